@@ -1,30 +1,118 @@
-import json
+"""
+Fetch publication metrics from OpenAlex and write data/metrics.json.
+
+Performance note: the hot paths (JSON parse, regex, histogram) already
+run in C via orjson/pysimdjson/numpy, so CPython is fine here. The
+remaining pure-Python normalize/dedupe code is annotated precisely
+enough to compile with `python -m mypyc scripts/fetch_metrics.py` if
+this ever processes orders of magnitude more works; PyPy is not an
+option since orjson and pysimdjson ship no PyPy wheels.
+"""
+
+import gzip
+import hashlib
+import heapq
+import math
 import os
 import re
+import string
+import sys
 import time
 import unicodedata
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import simdjson  # pysimdjson: lazy, SIMD-accelerated parsing
+except ImportError:
+    simdjson = None
+
+try:
+    import pyarrow as pa  # optional columnar export
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 OPENALEX_BASE = "https://api.openalex.org"
 USER_AGENT = "tzaragoza-site-metrics/1.0"
 
+# Only the fields normalize_work/dedupe_works actually read: this is a
+# memory-bound pipeline, so every selected field costs parse+alloc on
+# all pages. Re-add fields here only together with the code that uses
+# them.
+_WORKS_SELECT = ",".join([
+    # identifiers + basics
+    "id",
+    "doi",
+    "ids",
+    "title",
+    "display_name",   # fuzzy dedupe key fallback
+    "publication_year",
+    "type",
+    "type_crossref",
+
+    # citations / impact
+    "cited_by_count",
+    "fwci",
+    "citation_normalized_percentile",
+
+    # venue / location / OA footprint
+    "primary_location",
+    "locations",      # only consulted for HAL ids
+    "best_oa_location",
+    "open_access",
+
+    # topical metadata
+    "topics",
+    "keywords",
+
+    # collaboration metadata
+    "authorships",
+])
+
+
+# One session for the whole run: keeps TCP+TLS connections alive across
+# pages (a handshake per request costs ~50-150 ms otherwise) and retries
+# transient errors with backoff. Pool sized for the parallel fetcher.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+    # no br: urllib3 has no brotli decoder on this stack, and an
+    # undecoded brotli body would poison the disk cache
+    "Accept-Encoding": "gzip, deflate",
+})
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 
 def normalize_author_id(raw: str) -> str:
-    raw = (raw or "").strip()
-    raw = raw.replace("https://openalex.org/", "").strip()
-    raw = raw.upper()
+    raw = (raw or "").strip().replace("https://openalex.org/", "").upper()
     if not raw:
         raise ValueError("Missing OPENALEX_AUTHOR_ID")
-    if raw.startswith("A"):
-        return raw
-    # accept "a504..." or "504..."
-    if raw.startswith("A") is False and raw.startswith("A") is False:
-        return "A" + raw.lstrip("A")
-    return raw
+    # accept "A504...", "a504..." or "504..."
+    return "A" + raw.lstrip("A")
 
+@lru_cache(maxsize=100_000)
 def normalize_person_name(name: str) -> str:
     """
     Canonicalize person names:
@@ -32,14 +120,19 @@ def normalize_person_name(name: str) -> str:
     - Strip accents
     - Collapse spaces
     - Title case
+
+    Cached: the same coauthors recur across works, so most calls are
+    dict hits rather than re-normalization -- the cache is where the
+    speedup comes from. The combining() filter keeps full Unicode
+    coverage (Arabic harakat, Hebrew niqqud, ...), which no fixed set
+    of regex ranges matches.
     """
     if not name:
         return ""
 
-    # Normalize unicode (é → e + ́)
+    # Normalize unicode (e + combining acute etc.), then drop every
+    # combining mark. Always normalize first, even for NFKD input.
     name = unicodedata.normalize("NFKD", name)
-
-    # Remove accents
     name = "".join(c for c in name if not unicodedata.combining(c))
 
     # Normalize whitespace
@@ -48,14 +141,69 @@ def normalize_person_name(name: str) -> str:
     # Canonical casing
     return name.title()
 
-def _get(url: str, params: Optional[dict] = None) -> dict:
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+# On-disk response cache: raw gzipped bodies keyed by (url, params),
+# fresh for a day, revalidated with ETag/If-None-Match afterwards.
+# Makes warm re-runs (local hacking, CI retries) nearly network-free.
+_CACHE_DIR = os.getenv("OPENALEX_CACHE_DIR", ".openalex_cache")
+_CACHE_TTL = 86400  # seconds
+
+
+def _cache_paths(url: str, params: dict) -> Tuple[str, str]:
+    key = hashlib.blake2b(
+        orjson.dumps({"url": url, "params": {k: str(v) for k, v in sorted(params.items())}}),
+        digest_size=16,
+    ).hexdigest()
+    base = os.path.join(_CACHE_DIR, key)
+    return base + ".json.gz", base + ".meta"
+
+
+def _cache_write(path: str, data: bytes) -> None:
+    # temp + replace so concurrent fetcher threads never see partial files
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _parse_body(content: bytes) -> Any:
+    if simdjson is not None:
+        # Lazy parse: downstream code only .get()s ~20 of the selected
+        # fields per work, and simdjson materializes Python objects only
+        # for the subtrees actually accessed. One parser per page, since
+        # reusing a parser would invalidate the previous page's proxies
+        # while `works` is still accumulating across pages.
+        return simdjson.Parser().parse(content)
+    # orjson parses the raw UTF-8 bytes directly (SIMD-accelerated C),
+    # several times faster than stdlib json on these ~200-work pages
+    return orjson.loads(content)
+
+
+def _get(url: str, params: Optional[dict] = None) -> Any:
+    # Returns a dict, or a dict-like simdjson.Object when pysimdjson is
+    # installed; callers only use .get()-style access so both work.
     params = params or {}
     email = os.getenv("OPENALEX_EMAIL")
     if email:
         params["mailto"] = email
 
-    r = requests.get(url, params=params, headers=headers, timeout=30)
+    body_path, meta_path = _cache_paths(url, params)
+    etag = None
+    if os.path.exists(body_path) and os.path.exists(meta_path):
+        with open(meta_path, "rb") as f:
+            meta = orjson.loads(f.read())
+        if time.time() - meta.get("fetched_at", 0) < _CACHE_TTL:
+            with open(body_path, "rb") as f:
+                return _parse_body(gzip.decompress(f.read()))
+        etag = meta.get("etag")
+
+    headers = {"If-None-Match": etag} if etag else None
+    r = SESSION.get(url, params=params, headers=headers, timeout=30)
+
+    if r.status_code == 304:
+        # unchanged upstream: reuse the stored body, refresh its clock
+        _cache_write(meta_path, orjson.dumps({"etag": etag, "fetched_at": time.time()}))
+        with open(body_path, "rb") as f:
+            return _parse_body(gzip.decompress(f.read()))
 
     if not r.ok:
         print("OpenAlex error:", r.status_code)
@@ -63,7 +211,12 @@ def _get(url: str, params: Optional[dict] = None) -> dict:
 
 
     r.raise_for_status()
-    return r.json()
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    _cache_write(body_path, gzip.compress(r.content))
+    _cache_write(meta_path, orjson.dumps(
+        {"etag": r.headers.get("ETag"), "fetched_at": time.time()}
+    ))
+    return _parse_body(r.content)
 
 
 def fetch_all_works_for_author(author_id: str, per_page: int = 200) -> List[dict]:
@@ -71,64 +224,16 @@ def fetch_all_works_for_author(author_id: str, per_page: int = 200) -> List[dict
     Fetch all works for an author, using cursor pagination.
     """
     works: List[dict] = []
-    cursor = "*"
     url = f"{OPENALEX_BASE}/works"
-    flt = f"authorships.author.id:{author_id}"
+    params = {
+        "filter": f"authorships.author.id:{author_id}",
+        "per-page": per_page,
+        "cursor": "*",
+        "select": _WORKS_SELECT,
+    }
 
     while True:
-        data = _get(
-            url,
-            params={
-                "filter": flt,
-                "per-page": per_page,
-                "cursor": cursor,
-                # keep payload small; add more fields if you need them
-                "select": ",".join([
-                    # identifiers + basics
-                    "id",
-                    "doi",
-                    "ids",
-                    "title",
-                    "display_name",
-                    "publication_year",
-                    "publication_date",
-                    "type",
-                    "type_crossref",
-
-                    # citations / impact
-                    "cited_by_count",
-                    "counts_by_year",
-                    "fwci",
-                    "citation_normalized_percentile",
-                    "cited_by_percentile_year",
-
-                    # venue / location / OA footprint
-                    "primary_location",
-                    "locations",
-                    "best_oa_location",
-                    "open_access",
-
-                    # topical metadata
-                    "primary_topic",
-                    "topics",
-                    "keywords",
-                    "concepts",
-
-                    # collaboration metadata
-                    "authorships",
-
-                    # money / policy-ish
-                    "apc_list",
-                    "apc_paid",
-                    "funders",
-                    "awards",
-                    "sustainable_development_goals",
-
-                    # bookkeeping
-                    "updated_date",
-                ])
-            },
-        )
+        data = _get(url, params=params)
 
         batch = data.get("results", [])
         works.extend(batch)
@@ -136,6 +241,7 @@ def fetch_all_works_for_author(author_id: str, per_page: int = 200) -> List[dict
         cursor = data.get("meta", {}).get("next_cursor")
         if not cursor:
             break
+        params["cursor"] = cursor
 
         # be polite (OpenAlex is generous but don't spam)
         time.sleep(0.15)
@@ -143,22 +249,60 @@ def fetch_all_works_for_author(author_id: str, per_page: int = 200) -> List[dict
     return works
 
 
-def pick_best_url(work: dict) -> str:
+# OpenAlex page-based pagination only reaches the first 10k records;
+# beyond that we must fall back to cursor pagination.
+_PAGE_PAGINATION_LIMIT = 10_000
+
+
+def fetch_all_works_parallel(author_id: str, per_page: int = 200, workers: int = 8) -> List[dict]:
+    """
+    Fetch all works for an author with concurrent page requests.
+
+    One cheap probe reads meta.count, then the pages are fetched in a
+    thread pool (the workload is purely I/O-bound). Falls back to the
+    serial cursor paginator for authors beyond the 10k page-pagination
+    window. No sleep needed: the pool size caps concurrent requests.
+    """
+    url = f"{OPENALEX_BASE}/works"
+    base_params = {
+        "filter": f"authorships.author.id:{author_id}",
+        "select": _WORKS_SELECT,
+    }
+
+    probe = _get(url, params={**base_params, "per-page": 1, "page": 1})
+    count = int(probe.get("meta", {}).get("count") or 0)
+    if count == 0:
+        return []
+    if count > _PAGE_PAGINATION_LIMIT:
+        return fetch_all_works_for_author(author_id, per_page=per_page)
+
+    n_pages = math.ceil(count / per_page)
+
+    def fetch_page(page: int) -> List[dict]:
+        data = _get(url, params={**base_params, "per-page": per_page, "page": page})
+        return list(data.get("results", []))
+
+    works: List[dict] = []
+    with ThreadPoolExecutor(max_workers=min(workers, n_pages)) as pool:
+        for batch in pool.map(fetch_page, range(1, n_pages + 1)):
+            works.extend(batch)
+
+    return works
+
+
+def pick_best_url(ids: dict, pl: dict, wid: Any) -> str:
     """
     Prefer DOI URL if available, else landing page, else OpenAlex URL.
     """
-    ids = work.get("ids") or {}
     doi_url = ids.get("doi")  # usually https://doi.org/...
     if isinstance(doi_url, str) and doi_url.startswith("http"):
         return doi_url
 
-    loc = work.get("primary_location") or {}
-    landing = loc.get("landing_page_url")
+    landing = pl.get("landing_page_url")
     if isinstance(landing, str) and landing.startswith("http"):
         return landing
 
     # fallback to OpenAlex work url
-    wid = work.get("id")
     if isinstance(wid, str) and wid.startswith("http"):
         return wid
     if isinstance(wid, str):
@@ -166,176 +310,277 @@ def pick_best_url(work: dict) -> str:
     return "#"
 
 
-def extract_venue(work: dict) -> str:
+def extract_venue(pl: dict, bol: dict) -> str:
     # OpenAlex: host_venue is deprecated/removed; use primary_location/source
-    pl = work.get("primary_location") or {}
+    # (interned: venues repeat across works, so duplicates share one object)
     src = pl.get("source") or {}
     name = src.get("display_name")
     if isinstance(name, str) and name.strip():
-        return name.strip()
+        return sys.intern(name.strip())
 
     # fallback: sometimes best_oa_location has a source
-    bol = work.get("best_oa_location") or {}
     src2 = bol.get("source") or {}
     name2 = src2.get("display_name")
     if isinstance(name2, str) and name2.strip():
-        return name2.strip()
+        return sys.intern(name2.strip())
 
     return "—"
 
 
 
-_HAL_RE = re.compile(r"\bhal\.science\b|\bhal\.\w+\b", re.IGNORECASE)
+# matched against pre-lowered text, so no re.IGNORECASE needed
+_HAL_RE = re.compile(r"\bhal\.science\b|\bhal\.\w+\b")
 
 
-def try_find_hal_url(work: dict) -> Optional[str]:
+def try_find_hal_url(ids: dict, pl: dict, hv: dict) -> Optional[str]:
     """
     Best-effort: scan likely URL fields for HAL links.
     """
     candidates: List[str] = []
 
-    ids = work.get("ids") or {}
     for k in ("openalex", "doi", "pmid", "pmcid", "mag"):
         v = ids.get(k)
         if isinstance(v, str):
             candidates.append(v)
 
-    loc = work.get("primary_location") or {}
     for k in ("landing_page_url", "pdf_url"):
-        v = loc.get(k)
+        v = pl.get(k)
         if isinstance(v, str):
             candidates.append(v)
 
     # Some HAL links appear in other locations; scan host_venue url too
-    hv = work.get("host_venue") or {}
     v = hv.get("url")
     if isinstance(v, str):
         candidates.append(v)
 
     for u in candidates:
-        if u and _HAL_RE.search(u):
+        if not u:
+            continue
+        ul = u.lower()
+        # cheap substring pre-check rejects almost every URL before the
+        # regex engine ever runs
+        if "hal." not in ul:
+            continue
+        if _HAL_RE.search(ul):
             return u
 
     return None
 
-def _safe_float(x) -> float | None:
-    try:
+def _safe_float(x: Any) -> float | None:
+    # isinstance fast-path: OpenAlex sends numbers here essentially
+    # always, so keep the exception machinery off the hot path
+    if isinstance(x, float):
+        return x
+    if isinstance(x, int):
         return float(x)
-    except Exception:
-        return None
+    if isinstance(x, str):
+        try:
+            return float(x)
+        except ValueError:
+            return None
+    return None
 
-def _safe_int(x) -> int | None:
-    try:
+def _safe_int(x: Any) -> int | None:
+    if isinstance(x, int):
+        return x
+    if isinstance(x, float):
         return int(x)
-    except Exception:
-        return None
+    if isinstance(x, str):
+        try:
+            return int(x)
+        except ValueError:
+            return None
+    return None
 
-def extract_oa_status(work: dict) -> str:
-    oa = work.get("open_access") or {}
+def extract_oa_status(oa: dict) -> str:
     # typical values: gold, green, hybrid, bronze, closed
     s = oa.get("oa_status")
     if isinstance(s, str) and s.strip():
-        return s.strip().lower()
+        return sys.intern(s.strip().lower())
     return "unknown"
 
-def extract_is_oa(work: dict) -> bool:
-    oa = work.get("open_access") or {}
+def extract_is_oa(oa: dict) -> bool:
     v = oa.get("is_oa")
     return bool(v) if isinstance(v, bool) else False
 
-def extract_topics(work: dict, top_k: int = 3) -> list[str]:
+def extract_topics(topics: list, top_k: int = 3) -> list[str]:
     # topics is a list of objects with display_name / score
-    topics = work.get("topics") or []
+    # (list-like: may be a simdjson Array, so no isinstance(list) check)
     out = []
-    if isinstance(topics, list):
-        for t in sorted(topics, key=lambda x: x.get("score", 0), reverse=True)[:top_k]:
-            name = (t or {}).get("display_name")
-            if isinstance(name, str) and name.strip():
-                out.append(name.strip())
+    # O(n log k) with k=3, vs sorting the whole list
+    for t in heapq.nlargest(top_k, topics, key=lambda x: x.get("score") or 0):
+        name = (t or {}).get("display_name")
+        if isinstance(name, str) and name.strip():
+            out.append(sys.intern(name.strip()))
     return out
 
-def extract_keywords(work: dict, top_k: int = 10) -> list[str]:
-    kws = work.get("keywords") or []
+def extract_keywords(kws: list, top_k: int = 10) -> list[str]:
     out = []
-    if isinstance(kws, list):
-        for k in sorted(kws, key=lambda x: x.get("score", 0), reverse=True)[:top_k]:
-            name = (k or {}).get("display_name")
-            if isinstance(name, str) and name.strip():
-                out.append(name.strip())
+    for k in heapq.nlargest(top_k, kws, key=lambda x: x.get("score") or 0):
+        name = (k or {}).get("display_name")
+        if isinstance(name, str) and name.strip():
+            out.append(sys.intern(name.strip()))
     return out
 
-def extract_coauthors(work: dict, self_author_id: str) -> list[str]:
-    auths = work.get("authorships") or []
+def extract_coauthors(auths: list, self_author_id: str, self_author_url: str) -> list[str]:
     names: list[str] = []
 
-    if not isinstance(auths, list):
-        return names
-
     for a in auths:
         au = (a or {}).get("author") or {}
         aid = au.get("id")
         raw_name = au.get("display_name")
 
-        if isinstance(aid, str) and aid.replace("https://openalex.org/", "") == self_author_id:
+        # plain equality against both forms; no per-authorship .replace()
+        if aid == self_author_id or aid == self_author_url:
             continue
 
         if isinstance(raw_name, str) and raw_name.strip():
-            names.append(normalize_person_name(raw_name))
+            # intern so repeated coauthors share one string object across
+            # the whole works list (and compare by pointer downstream)
+            names.append(sys.intern(normalize_person_name(raw_name)))
 
     return names
 
 
-def normalize_work(work: dict, self_author_id: str) -> Dict[str, Any]:
+@dataclass
+class Paper:
+    """
+    Normalized view of one deduped work.
+
+    Cheap scalars are computed eagerly by normalize_work; the expensive
+    list fields (coauthors, topics, keywords) are cached_properties that
+    walk the raw work only when first asked for. Not slots=True:
+    cached_property needs an instance __dict__.
+    """
+    id: Optional[str]
+    title: str
+    year: Optional[int]
+    venue: str
+    citations: int
+    doi: Optional[str]
+    url: str
+    hal_url: Optional[str]
+    type: str
+    is_oa: bool
+    oa_status: str
+    fwci: Optional[float]
+    citation_norm_percentile: Optional[float]
+    _w: Any = field(repr=False)
+    _self_author_id: str = field(repr=False)
+    _self_author_url: str = field(repr=False)
+
+    @cached_property
+    def topics(self) -> list[str]:
+        return extract_topics(self._w.get("topics") or [], top_k=3)
+
+    @cached_property
+    def keywords(self) -> list[str]:
+        return extract_keywords(self._w.get("keywords") or [], top_k=10)
+
+    @cached_property
+    def coauthors(self) -> list[str]:
+        return extract_coauthors(
+            self._w.get("authorships") or [],
+            self._self_author_id,
+            self._self_author_url,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        # full JSON-ready record, same shape the frontend already reads
+        return {
+            "id": self.id,
+            "title": self.title,
+            "year": self.year,
+            "venue": self.venue,
+            "citations": self.citations,
+            "doi": self.doi,
+            "url": self.url,
+            "hal_url": self.hal_url,
+            "type": self.type,
+
+            # rich fields you requested (now actually kept)
+            "is_oa": self.is_oa,
+            "oa_status": self.oa_status,
+            "fwci": self.fwci,
+            "citation_norm_percentile": self.citation_norm_percentile,
+            "topics": self.topics,
+            "keywords": self.keywords,
+            "coauthors": self.coauthors,
+
+            "source": "OpenAlex",
+        }
+
+
+def normalize_work(work: dict, self_author_id: str) -> Paper:
+    # Unpack each shared subdict exactly once and thread them into the
+    # small helpers, instead of every helper re-walking the work.
+    ids = work.get("ids") or {}
+    pl = work.get("primary_location") or {}
+    bol = work.get("best_oa_location") or {}
+    oa = work.get("open_access") or {}
+    hv = work.get("host_venue") or {}
+    wid = work.get("id")
+
     title = (work.get("title") or "").strip() or "Untitled"
     year = _safe_int(work.get("publication_year"))
     cites = _safe_int(work.get("cited_by_count")) or 0
 
-    ids = work.get("ids") or {}
     doi = work.get("doi") or ids.get("doi")
     if isinstance(doi, str):
         doi = doi.strip().replace("https://doi.org/", "")
     else:
         doi = None
 
-    openalex_id = work.get("id")
-    if isinstance(openalex_id, str):
-        openalex_id = openalex_id.replace("https://openalex.org/", "")
-    else:
-        openalex_id = None
-
-    return {
-        "id": openalex_id,
-        "title": title,
-        "year": year,
-        "venue": extract_venue(work),
-        "citations": cites,
-        "doi": doi,
-        "url": pick_best_url(work),
-        "hal_url": try_find_hal_url(work),
-        "type": (work.get("type") or work.get("type_crossref") or "").strip() or "—",
-
-        # rich fields you requested (now actually kept)
-        "is_oa": extract_is_oa(work),
-        "oa_status": extract_oa_status(work),
-        "fwci": _safe_float(work.get("fwci")),
-        "citation_norm_percentile": (work.get("citation_normalized_percentile") or {}).get("value"),
-        "topics": extract_topics(work, top_k=3),
-        "keywords": extract_keywords(work, top_k=10),
-        "coauthors": extract_coauthors(work, self_author_id),
-
-        "source": "OpenAlex",
-    }
+    openalex_id = wid.replace("https://openalex.org/", "") if isinstance(wid, str) else None
+
+    return Paper(
+        id=openalex_id,
+        title=title,
+        year=year,
+        venue=extract_venue(pl, bol),
+        citations=cites,
+        doi=doi,
+        url=pick_best_url(ids, pl, wid),
+        hal_url=try_find_hal_url(ids, pl, hv),
+        type=(work.get("type") or work.get("type_crossref") or "").strip() or "—",
+        is_oa=extract_is_oa(oa),
+        oa_status=extract_oa_status(oa),
+        fwci=_safe_float(work.get("fwci")),
+        citation_norm_percentile=(work.get("citation_normalized_percentile") or {}).get("value"),
+        _w=work,
+        _self_author_id=self_author_id,
+        _self_author_url="https://openalex.org/" + self_author_id,
+    )
 
 
 def build_citations_by_year(papers: List[Dict[str, Any]]) -> List[Dict[str, int]]:
-    by_year: Dict[int, int] = {}
-    for p in papers:
-        y = p.get("year")
-        c = p.get("citations") or 0
-        if isinstance(y, int):
-            by_year[y] = by_year.get(y, 0) + int(c)
-
-    return [{"year": y, "citations": by_year[y]} for y in sorted(by_year.keys())]
+    # Accumulate in a dense numpy histogram instead of a per-paper
+    # Python dict-get+assign loop. Pairs are gathered together so years
+    # and citations stay aligned under the same filter.
+    pairs = [
+        (p["year"], int(p.get("citations") or 0))
+        for p in papers
+        if isinstance(p.get("year"), int)
+    ]
+    if not pairs:
+        return []
+
+    arr = np.asarray(pairs, dtype=np.int64)
+    years, cites = arr[:, 0], arr[:, 1]
+    ymin = int(years.min())
+    offsets = years - ymin
+
+    bins = np.zeros(int(years.max()) - ymin + 1, dtype=np.int64)
+    np.add.at(bins, offsets, cites)
+    # only emit years that actually have papers, as before
+    counts = np.bincount(offsets, minlength=len(bins))
+
+    # numpy scalars flow straight into orjson via OPT_SERIALIZE_NUMPY
+    return [
+        {"year": ymin + i, "citations": c}
+        for i, (c, n) in enumerate(zip(bins, counts))
+        if n
+    ]
 
 def _norm_doi(doi: str | None) -> str | None:
     if not doi:
@@ -350,10 +595,11 @@ def _get_doi(work: Dict[str, Any]) -> str | None:
     doi = work.get("doi")
     if isinstance(doi, str):
         return _norm_doi(doi)
-    # sometimes in ids
+    # sometimes in ids (duck-typed .get: may be a simdjson Object)
     ids = work.get("ids") or {}
-    if isinstance(ids, dict) and isinstance(ids.get("doi"), str):
-        return _norm_doi(ids["doi"])
+    ids_doi = ids.get("doi")
+    if isinstance(ids_doi, str):
+        return _norm_doi(ids_doi)
     return None
 
 def _get_hal_id(work: Dict[str, Any]) -> str | None:
@@ -376,16 +622,23 @@ def _get_hal_id(work: Dict[str, Any]) -> str | None:
 
     return None
 
+# leading chapter numbers like "17 " or "17."
+_CHAPTER_RE = re.compile(r"^\s*\d+\s*[\.\-:\)]\s*")
+# ASCII punctuation → spaces in one C-level pass (no regex engine involved)
+_PUNCT_TBL = str.maketrans({c: " " for c in string.punctuation})
+# catch-all for Unicode punctuation the ASCII table misses (curly
+# quotes, em-dashes, ...), mapped to space too so "don't" and "don’t"
+# normalize to the same key
+_NONWORD_RE = re.compile(r"[^\w\s]")
+
+
 def _norm_title(title: str | None) -> str:
     if not title:
         return ""
-    t = title.lower().strip()
-    # remove leading chapter numbers like "17 " or "17."
-    t = re.sub(r"^\s*\d+\s*[\.\-:\)]\s*", "", t)
-    # normalize punctuation/whitespace
-    t = re.sub(r"\s+", " ", t)
-    t = re.sub(r"[^\w\s]", "", t)
-    return t.strip()
+    t = _CHAPTER_RE.sub("", title.lower()).translate(_PUNCT_TBL)
+    t = _NONWORD_RE.sub(" ", t)
+    # collapse whitespace without another regex pass
+    return " ".join(t.split())
 
 def _first_author(work: Dict[str, Any]) -> str:
     auths = work.get("authorships") or []
@@ -395,45 +648,54 @@ def _first_author(work: Dict[str, Any]) -> str:
     name = a0.get("display_name") or ""
     return str(name).strip().lower()
 
-def dedupe_works(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    buckets: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+# Precomputed per-work record: (work, doi, hal_id, cited_by_count, source_type)
+_DedupeRecord = Tuple[Dict[str, Any], Optional[str], Optional[str], int, str]
 
+
+def dedupe_works(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # One pass to compute everything both the bucketing and the tiebreak
+    # need, so _get_doi / the location walk run at most once per work.
+    records: List[_DedupeRecord] = []
     for w in works:
         doi = _get_doi(w)
-        if doi:
-            key = ("doi", doi)
-        else:
-            hal = _get_hal_id(w)
-            if hal:
-                key = ("hal", hal)
-            else:
-                # last resort: normalized title + year + first author
-                key = ("fuzzy", f"{_norm_title(w.get('title') or w.get('display_name'))}|{w.get('publication_year')}|{_first_author(w)}")
-
-        buckets.setdefault(key, []).append(w)
-
-    def score(work: Dict[str, Any]) -> Tuple[int, int, int]:
-        # Higher is better
-        has_doi = 1 if _get_doi(work) else 0
-        cites = int(work.get("cited_by_count") or 0)
+        hal = None if doi else _get_hal_id(w)
+        cites = int(w.get("cited_by_count") or 0)
 
         # Prefer publisher/journal/book source over repository if possible
         # Heuristic: best_oa_location / primary_location has a 'source' with type not 'repository'
-        loc = work.get("best_oa_location") or work.get("primary_location") or {}
-        src = (loc.get("source") or {}) if isinstance(loc, dict) else {}
+        loc = w.get("best_oa_location") or w.get("primary_location") or {}
+        src = loc.get("source") or {}
         src_type = str(src.get("type") or "").lower()
-        is_repo = 1 if src_type == "repository" else 0
-        publisher_bonus = 1 - is_repo  # 1 if not repo, 0 if repo
 
+        records.append((w, doi, hal, cites, src_type))
+
+    buckets: Dict[Tuple[str, str], List[_DedupeRecord]] = defaultdict(list)
+    for rec in records:
+        w, doi, hal, _, _ = rec
+        if doi:
+            key = ("doi", doi)
+        elif hal:
+            key = ("hal", hal)
+        else:
+            # last resort: normalized title + year + first author
+            key = ("fuzzy", f"{_norm_title(w.get('title') or w.get('display_name'))}|{w.get('publication_year')}|{_first_author(w)}")
+
+        buckets[key].append(rec)
+
+    def score(rec: _DedupeRecord) -> Tuple[int, int, int]:
+        # Higher is better; everything was precomputed above
+        _, doi, _, cites, src_type = rec
+        has_doi = 1 if doi else 0
+        publisher_bonus = 0 if src_type == "repository" else 1
         return (has_doi, cites, publisher_bonus)
 
     deduped: List[Dict[str, Any]] = []
-    for _, group in buckets.items():
+    for group in buckets.values():
         if len(group) == 1:
-            deduped.append(group[0])
+            deduped.append(group[0][0])
         else:
-            group_sorted = sorted(group, key=score, reverse=True)
-            winner = group_sorted[0]
+            # O(n) max-scan; we only ever need the single winner
+            winner = max(group, key=score)[0]
 
             # OPTIONAL: if you want, you can merge citations/ids from losers here.
             deduped.append(winner)
@@ -445,16 +707,22 @@ def main() -> None:
     raw_author_id = os.getenv("OPENALEX_AUTHOR_ID", "A5042578790")
     author_id = normalize_author_id(raw_author_id)
 
-    works = fetch_all_works_for_author(author_id=author_id)
+    works = fetch_all_works_parallel(author_id=author_id)
+
+    # Invariant: dedupe runs on the raw works BEFORE normalization, so
+    # the losers are never normalized at all. Keep it that way.
     works = dedupe_works(works)
 
     papers = [normalize_work(w, self_author_id=author_id) for w in works]
 
     # Sort: newest first, then citations desc
-    papers.sort(key=lambda p: ((p.get("year") or 0), (p.get("citations") or 0)), reverse=True)
+    papers.sort(key=lambda p: ((p.year or 0), p.citations), reverse=True)
+
+    total_citations = sum(p.citations for p in papers)
 
-    total_citations = sum(int(p.get("citations") or 0) for p in papers)
-    citations_by_year = build_citations_by_year(papers)
+    # one materialization point: lazy Paper fields resolve here
+    works_out = [p.to_dict() for p in papers]
+    citations_by_year = build_citations_by_year(works_out)
 
     out = {
         "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
@@ -466,12 +734,19 @@ def main() -> None:
         "citations_by_year": citations_by_year,
 
         # main payload
-        "works": papers,
+        "works": works_out,
     }
 
     os.makedirs("data", exist_ok=True)
-    with open("data/metrics.json", "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    # orjson emits UTF-8 bytes directly; indent kept so the committed
+    # file stays diffable
+    with open("data/metrics.json", "wb") as f:
+        f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+    # Columnar twin of `works` for consumers that want CSV/Parquet-style
+    # analysis without re-parsing the JSON. Skipped if pyarrow is absent.
+    if pa is not None:
+        pq.write_table(pa.Table.from_pylist(works_out), "data/metrics.parquet")
 
     print(
         f"[OK] Fetched {out['papers_tracked']} works for {author_id}, "